@@ -6,7 +6,10 @@ No database. No external service. Just a local file for:
   - Union defensibility
   - Determinism verification
 
-Thread-safe via a module-level lock.
+Writes happen on a background daemon thread fed by a bounded queue, so
+callers (tool dispatch in particular) never block on file I/O. Under a
+log storm the oldest queued records are dropped rather than growing the
+queue without bound.
 """
 
 from __future__ import annotations
@@ -14,6 +17,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
@@ -25,6 +29,57 @@ _LOG_DIR = Path(os.getenv("AUDIT_LOG_DIR", "/logs"))
 _LOG_FILE = _LOG_DIR / "estimate_runs.jsonl"
 _lock = threading.Lock()
 
+_QUEUE_MAX = int(os.getenv("AUDIT_LOG_QUEUE_MAX", "10000"))
+_queue: queue.Queue[str] = queue.Queue(maxsize=_QUEUE_MAX)
+_writer_started = False
+_writer_lock = threading.Lock()
+
+
+def _writer_loop() -> None:
+    """Drain queued records into the JSONL sink. Runs on a daemon thread."""
+    while True:
+        line = _queue.get()
+        _write_line(line)
+
+
+def _ensure_writer() -> None:
+    global _writer_started
+    if _writer_started:
+        return
+    with _writer_lock:
+        if _writer_started:
+            return
+        t = threading.Thread(target=_writer_loop, name="audit-log-writer", daemon=True)
+        t.start()
+        _writer_started = True
+
+
+def _enqueue(line: str) -> None:
+    """Queue a record for the writer thread; drop oldest when full."""
+    _ensure_writer()
+    try:
+        _queue.put_nowait(line)
+    except queue.Full:
+        try:
+            _queue.get_nowait()  # drop oldest under log storms
+        except queue.Empty:
+            pass
+        try:
+            _queue.put_nowait(line)
+        except queue.Full:
+            pass
+
+
+def _write_line(line: str) -> None:
+    with _lock:
+        if not _ensure_log_dir():
+            return
+        try:
+            with open(_LOG_FILE, "a") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.error("Failed to write audit log: %s", e)
+
 
 def _ensure_log_dir() -> bool:
     """Create the log directory if it doesn't exist. Returns True on success."""
@@ -59,16 +114,7 @@ def log_estimate_run(
     if extra:
         record["extra"] = extra
 
-    line = json.dumps(record, separators=(",", ":"))
-
-    with _lock:
-        if not _ensure_log_dir():
-            return
-        try:
-            with open(_LOG_FILE, "a") as f:
-                f.write(line + "\n")
-        except OSError as e:
-            logger.error("Failed to write audit log: %s", e)
+    _enqueue(json.dumps(record, separators=(",", ":")))
 
 
 def log_tool_call(
@@ -92,13 +138,4 @@ def log_tool_call(
     if extra:
         record["extra"] = extra
 
-    line = json.dumps(record, separators=(",", ":"))
-
-    with _lock:
-        if not _ensure_log_dir():
-            return
-        try:
-            with open(_LOG_FILE, "a") as f:
-                f.write(line + "\n")
-        except OSError as e:
-            logger.error("Failed to write audit log: %s", e)
+    _enqueue(json.dumps(record, separators=(",", ":")))
@@ -36,11 +36,10 @@ from .contracts.blueprint.validate_blueprint_parse import (
     RUNTIME,
 )
 from .contracts.governance import get_vertex_stamp
+from .workspace_tools import get_workspace_root
 
 logger = logging.getLogger(__name__)
 
-WORKSPACE_ROOT = os.getenv("WORKSPACE_ROOT", "/workspaces")
-
 # Detection output schema version
 DETECTION_SCHEMA_VERSION = "SymbolDetectionV1"
 
@@ -93,7 +92,7 @@ def _abs(workspace: str, path: str) -> str:
     """Resolve workspace-relative path with traversal protection."""
     if "/" in workspace or ".." in workspace:
         raise ValueError("Invalid workspace")
-    base = os.path.join(WORKSPACE_ROOT, workspace)
+    base = os.path.join(get_workspace_root(), workspace)
     full = os.path.normpath(os.path.join(base, path))
     if not full.startswith(base):
         raise ValueError("Path traversal blocked")
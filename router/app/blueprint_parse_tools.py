@@ -28,11 +28,10 @@ from .contracts.blueprint.validate_blueprint_parse import (
     validate_or_error,
 )
 from .contracts.governance import get_vertex_stamp
+from .workspace_tools import get_workspace_root
 
 logger = logging.getLogger(__name__)
 
-WORKSPACE_ROOT = os.getenv("WORKSPACE_ROOT", "/workspaces")
-
 # Schema version for forward compatibility
 SCHEMA_VERSION = "BlueprintParseV1"
 
@@ -65,7 +64,7 @@ def _abs(workspace: str, path: str) -> str:
     """Resolve workspace-relative path with traversal protection."""
     if "/" in workspace or ".." in workspace:
         raise ValueError("Invalid workspace")
-    base = os.path.join(WORKSPACE_ROOT, workspace)
+    base = os.path.join(get_workspace_root(), workspace)
     full = os.path.normpath(os.path.join(base, path))
     if not full.startswith(base):
         raise ValueError("Path traversal blocked")
@@ -79,7 +78,9 @@ def _render_page_png(
 ) -> dict:
     """Render a single page to PNG and return metadata."""
     mat = fitz.Matrix(dpi / 72.0, dpi / 72.0)
-    pix = page.get_pixmap(matrix=mat)
+    # Drawings have no transparency; dropping the alpha channel saves a
+    # quarter of the pixel buffer and shrinks the PNGs.
+    pix = page.get_pixmap(matrix=mat, alpha=False)
     pix.save(output_path)
     return {
         "path": output_path,
@@ -282,11 +283,9 @@ def _write_debug_overlay_png(
     dpi: int = DEFAULT_DPI,
 ) -> str:
     """Render a debug PNG with block outlines and legend regions highlighted."""
-    # Render page at target DPI
     mat = fitz.Matrix(dpi / 72.0, dpi / 72.0)
-    pix = page.get_pixmap(matrix=mat)
 
-    # We'll draw annotations directly on the fitz page copy, then render
+    # Draw annotations on a copy of the page, then render that copy once
     # Create a temporary copy of the page's parent doc for annotation
     temp_doc = fitz.open()
     temp_doc.insert_pdf(page.parent, from_page=page.number, to_page=page.number)
@@ -311,7 +310,7 @@ def _write_debug_overlay_png(
         temp_page.draw_rect(rect, color=(1, 0, 0), width=2.0)
 
     # Render annotated page
-    pix = temp_page.get_pixmap(matrix=mat)
+    pix = temp_page.get_pixmap(matrix=mat, alpha=False)
     pix.save(output_path)
     temp_doc.close()
     return output_path
@@ -1,12 +1,12 @@
 import os, subprocess, textwrap
 
-WORKSPACE_ROOT = os.getenv("WORKSPACE_ROOT", "/workspaces")
+from .workspace_tools import get_workspace_root
 BROWSER_CONTAINER = "agent-browser"
 
 def _ws(workspace: str) -> str:
     if "/" in workspace or ".." in workspace:
         raise ValueError("Invalid workspace")
-    return os.path.join(WORKSPACE_ROOT, workspace)
+    return os.path.join(get_workspace_root(), workspace)
 
 def _exec_py(workspace: str, code: str):
     ws = _ws(workspace)
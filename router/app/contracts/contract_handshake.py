@@ -51,6 +51,17 @@ _handshake_passed: bool | None = None  # None = not yet attempted
 _handshake_errors: list[str] = []
 _handshake_detail: dict = {}  # rich detail for /health
 _handshake_timestamp: float = 0.0  # monotonic time of last handshake
+_state_epoch: int = 0  # bumped on every state transition (see state_epoch)
+
+
+def state_epoch() -> int:
+    """Monotonic counter bumped each time handshake state changes.
+
+    Lets hot callers (tool dispatch) cache the enforcement decision and
+    revalidate with a single integer compare instead of re-querying the
+    handshake and freeze state per call.
+    """
+    return _state_epoch
 
 
 def handshake_status() -> dict:
@@ -261,7 +272,7 @@ def run_handshake() -> bool:
     If CONTRACT_HANDSHAKE_FAIL_EXIT=true, exits the process on failure
     (exit code 78 = EX_CONFIG) to prevent a partially-valid runtime.
     """
-    global _handshake_passed, _handshake_errors, _handshake_detail, _handshake_timestamp
+    global _handshake_passed, _handshake_errors, _handshake_detail, _handshake_timestamp, _state_epoch
 
     if not PLATFORM_BASE_URL:
         err_msg = (
@@ -274,6 +285,7 @@ def run_handshake() -> bool:
             ok=False, errors=[err_msg], mismatch_reason=err_msg,
         )
         _handshake_timestamp = time.monotonic()
+        _state_epoch += 1
         logger.error("CONTRACT HANDSHAKE FAILED: %s", err_msg)
         _maybe_exit()
         return False
@@ -317,6 +329,7 @@ def run_handshake() -> bool:
             ok=False, errors=[err_msg], mismatch_reason=err_msg,
         )
         _handshake_timestamp = time.monotonic()
+        _state_epoch += 1
         logger.error("CONTRACT HANDSHAKE FAILED: %s", err_msg)
         _maybe_exit()
         return False
@@ -334,6 +347,7 @@ def run_handshake() -> bool:
             platform_data=platform_data,
         )
         _handshake_timestamp = time.monotonic()
+        _state_epoch += 1
         for err in errors:
             logger.error("CONTRACT MISMATCH: %s", err)
         logger.error(
@@ -350,6 +364,7 @@ def run_handshake() -> bool:
         platform_data=platform_data,
     )
     _handshake_timestamp = time.monotonic()
+    _state_epoch += 1
     logger.info("CONTRACT HANDSHAKE PASSED — all contracts verified")
     return True
 
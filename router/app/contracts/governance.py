@@ -13,11 +13,12 @@ or output schemas MUST go through a versioned change request — never a hot pat
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -39,7 +40,7 @@ def _load_manifest() -> tuple[dict, str]:
 
     raw = _FREEZE_PATH.read_bytes()
     _manifest_hash = hashlib.sha256(raw).hexdigest()
-    _manifest = json.loads(raw)
+    _manifest = orjson.loads(raw)
     logger.info(
         "Loaded freeze manifest: vertex=%s version=%s status=%s hash=%s",
         _manifest.get("vertex"),
@@ -212,20 +213,35 @@ def classify_change_request(change_type: str) -> dict:
 # Response stamping — inject vertex metadata into tool results
 # ---------------------------------------------------------------------------
 
+# The stamp is a pure function of the (singleton) manifest, so one dict
+# is built on first use and shared by every stamped response. Treat it
+# as immutable.
+_stamp_cache: dict | None = None
+
+
+def _cached_stamp() -> dict:
+    global _stamp_cache
+    if _stamp_cache is None:
+        _stamp_cache = get_vertex_stamp()
+    return _stamp_cache
+
+
 def stamp_response(response: dict) -> dict:
     """Inject the vertex stamp into a tool response dict.
 
     Only stamps responses that have "ok": True (successful tool calls).
     The stamp is added under the "vertex" key at the top level.
 
-    This is non-destructive: if "vertex" already exists, it is preserved.
+    Mutates and returns the passed dict — no copy is made, so large tool
+    results (full parses, vendor result lists) are never duplicated.
+    If "vertex" already exists, it is preserved.
     """
     if not isinstance(response, dict):
         return response
     if not response.get("ok"):
         return response
     if "vertex" not in response:
-        response["vertex"] = get_vertex_stamp()
+        response["vertex"] = _cached_stamp()
     return response
 
 
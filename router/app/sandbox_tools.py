@@ -1,13 +1,13 @@
 import os, subprocess
 
-WORKSPACE_ROOT = os.getenv("WORKSPACE_ROOT", "/workspaces")
+from .workspace_tools import get_workspace_root
 RUNNER_CONTAINER = "agent-runner"
 
 def _safe_workspace_path(workspace: str) -> str:
     # prevent path traversal
     if "/" in workspace or ".." in workspace:
         raise ValueError("Invalid workspace name")
-    return os.path.join(WORKSPACE_ROOT, workspace)
+    return os.path.join(get_workspace_root(), workspace)
 
 def sandbox_run(workspace: str, cmd: str, timeout_sec: int = 600):
     ws = _safe_workspace_path(workspace)
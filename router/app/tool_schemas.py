@@ -1,4 +1,37 @@
-TOOLS = [
+"""OpenAI-style function schemas for every tool the router exposes.
+
+The schema list is large (~400 lines of literals), so it is built lazily
+via PEP 562 module __getattr__: workers that never touch tools (health
+checks, admin endpoints) skip the construction cost entirely. The built
+list is cached in module globals after first access.
+"""
+
+
+def __getattr__(name: str):
+    if name == "TOOLS":
+        tools = globals()["TOOLS"] = _build_tools()
+        return tools
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Name → schema index, built once alongside TOOLS. Callers that need one
+# tool's schema do a dict lookup instead of scanning the full list.
+_tools_by_name: dict[str, dict] | None = None
+
+
+def get_tool_schema(name: str) -> dict | None:
+    """Return the schema entry for a tool name, or None if unknown."""
+    global _tools_by_name
+    if _tools_by_name is None:
+        tools = globals().get("TOOLS")
+        if tools is None:
+            tools = globals()["TOOLS"] = _build_tools()
+        _tools_by_name = {t["function"]["name"]: t for t in tools}
+    return _tools_by_name.get(name)
+
+
+def _build_tools() -> list[dict]:
+    return [
   # ---- approvals ----
   {
     "type": "function",
@@ -241,12 +274,13 @@ TOOLS = [
     "type": "function",
     "function": {
       "name": "blueprint_extract_text",
-      "description": "Extract text and layout hints from a blueprint PDF. Returns per-page text blocks with bounding-box positions. First step of the blueprint takeoff pipeline.",
+      "description": "Extract text and layout hints from a blueprint PDF. Returns per-page text blocks with bounding-box positions plus a parse_id that blueprint_takeoff_low_voltage can reference via extracted_text_ref. First step of the blueprint takeoff pipeline.",
       "parameters": {
         "type": "object",
         "properties": {
           "workspace": {"type": "string", "description": "Workspace folder ID"},
-          "pdf_path": {"type": "string", "description": "Relative path to the PDF file inside the workspace"}
+          "pdf_path": {"type": "string", "description": "Relative path to the PDF file inside the workspace"},
+          "format": {"type": "string", "enum": ["blocks", "columnar"], "description": "Page payload shape: 'blocks' (list of per-block dicts) or 'columnar' (flat parallel lists; smaller on dense drawings)", "default": "blocks"}
         },
         "required": ["workspace", "pdf_path"]
       }
@@ -275,7 +309,8 @@ TOOLS = [
             }
           },
           "project_name": {"type": "string", "description": "Optional project name for the report header", "default": ""},
-          "drawing_number": {"type": "string", "description": "Optional drawing/sheet number", "default": ""}
+          "drawing_number": {"type": "string", "description": "Optional drawing/sheet number", "default": ""},
+          "extracted_text_ref": {"type": "string", "description": "Optional parse_id from a prior blueprint_extract_text call; when given the server-side cached extract is used and extracted_text may be an empty list", "default": ""}
         },
         "required": ["workspace", "extracted_text"]
       }
@@ -439,3 +474,4 @@ TOOLS = [
     }
   }
 ]
+
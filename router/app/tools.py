@@ -1,67 +1,114 @@
+import sys
 import time
+from dataclasses import dataclass
+from typing import Callable
 
 from fastapi import HTTPException
 
 from .audit_log import log_tool_call
-from .approvals import request_approval, check_approval
-from .sandbox_tools import sandbox_run
-from .workspace_tools import (
-    workspace_list,
-    workspace_list_roots,
-    workspace_read,
-    workspace_write,
-    get_available_workspaces,
-)
-from .github_tools import repo_commit, repo_open_pr
-from .browser_tools import (
-    browser_goto,
-    browser_click,
-    browser_type,
-    browser_screenshot,
-    browser_extract_text,
-)
-from .blueprint_tools import (
-    blueprint_extract_text,
-    blueprint_takeoff_low_voltage,
-    artifact_write_xlsx_takeoff,
-    artifact_write_docx_summary,
-)
-from .vendor_pricing_tools import (
-    vendor_price_search,
-    vendor_price_check,
-    vendor_list_sources,
-)
-from .blueprint_parse_tools import blueprint_parse_document
-from .blueprint_detect_tools import blueprint_detect_symbols, blueprint_list_models
+from .workspace_tools import get_workspace_ids, invalidate_roots_cache
 from .contracts.governance import stamp_response, get_locked_contracts, get_vertex_stamp, is_frozen
-from .contracts.contract_handshake import is_handshake_valid, handshake_status
-
-TOOL_MAP = {
-    "request_approval": request_approval,
-    "check_approval": check_approval,
-    "sandbox_run": sandbox_run,
-    "workspace_list_roots": workspace_list_roots,
-    "workspace_list": workspace_list,
-    "workspace_read": workspace_read,
-    "workspace_write": workspace_write,
-    "repo_commit": repo_commit,
-    "repo_open_pr": repo_open_pr,
-    "browser_goto": browser_goto,
-    "browser_click": browser_click,
-    "browser_type": browser_type,
-    "browser_screenshot": browser_screenshot,
-    "browser_extract_text": browser_extract_text,
-    "blueprint_extract_text": blueprint_extract_text,
-    "blueprint_takeoff_low_voltage": blueprint_takeoff_low_voltage,
-    "artifact_write_xlsx_takeoff": artifact_write_xlsx_takeoff,
-    "artifact_write_docx_summary": artifact_write_docx_summary,
-    "vendor_price_search": vendor_price_search,
-    "vendor_price_check": vendor_price_check,
-    "vendor_list_sources": vendor_list_sources,
-    "blueprint_parse_document": blueprint_parse_document,
-    "blueprint_detect_symbols": blueprint_detect_symbols,
-    "blueprint_list_models": blueprint_list_models,
-}
+from .contracts.contract_handshake import is_handshake_valid, handshake_status, state_epoch
+
+# TOOL_MAP is built lazily (PEP 562 __getattr__) so importing this module
+# does not pull in the heavy backend submodules (PyMuPDF, openpyxl,
+# python-docx via blueprint_tools) until the first real tool dispatch.
+_tool_map: dict | None = None
+
+
+def _build_tool_map() -> dict:
+    from .approvals import request_approval, check_approval
+    from .sandbox_tools import sandbox_run
+    from .workspace_tools import (
+        workspace_list,
+        workspace_list_roots,
+        workspace_read,
+        workspace_write,
+    )
+    from .github_tools import repo_commit, repo_open_pr
+    from .browser_tools import (
+        browser_goto,
+        browser_click,
+        browser_type,
+        browser_screenshot,
+        browser_extract_text,
+    )
+    from .blueprint_tools import (
+        blueprint_extract_text,
+        blueprint_takeoff_low_voltage,
+        artifact_write_xlsx_takeoff,
+        artifact_write_docx_summary,
+    )
+    from .vendor_pricing_tools import (
+        vendor_price_search,
+        vendor_price_check,
+        vendor_list_sources,
+    )
+    from .blueprint_parse_tools import blueprint_parse_document
+    from .blueprint_detect_tools import blueprint_detect_symbols, blueprint_list_models
+
+    return {
+        "request_approval": request_approval,
+        "check_approval": check_approval,
+        "sandbox_run": sandbox_run,
+        "workspace_list_roots": workspace_list_roots,
+        "workspace_list": workspace_list,
+        "workspace_read": workspace_read,
+        "workspace_write": workspace_write,
+        "repo_commit": repo_commit,
+        "repo_open_pr": repo_open_pr,
+        "browser_goto": browser_goto,
+        "browser_click": browser_click,
+        "browser_type": browser_type,
+        "browser_screenshot": browser_screenshot,
+        "browser_extract_text": browser_extract_text,
+        "blueprint_extract_text": blueprint_extract_text,
+        "blueprint_takeoff_low_voltage": blueprint_takeoff_low_voltage,
+        "artifact_write_xlsx_takeoff": artifact_write_xlsx_takeoff,
+        "artifact_write_docx_summary": artifact_write_docx_summary,
+        "vendor_price_search": vendor_price_search,
+        "vendor_price_check": vendor_price_check,
+        "vendor_list_sources": vendor_list_sources,
+        "blueprint_parse_document": blueprint_parse_document,
+        "blueprint_detect_symbols": blueprint_detect_symbols,
+        "blueprint_list_models": blueprint_list_models,
+    }
+
+
+def _get_tool_map() -> dict:
+    global _tool_map
+    if _tool_map is None:
+        _tool_map = _build_tool_map()
+    return _tool_map
+
+
+@dataclass(slots=True, frozen=True)
+class ToolEntry:
+    """Precomputed dispatch descriptor — one registry lookup per call."""
+
+    fn: Callable
+    needs_workspace: bool
+    is_frozen: bool
+
+
+_tool_registry: dict[str, ToolEntry] | None = None
+
+
+def _get_tool_registry() -> dict[str, ToolEntry]:
+    global _tool_registry
+    if _tool_registry is None:
+        _tool_registry = {
+            name: ToolEntry(fn, name in _WORKSPACE_TOOLS, name in _FROZEN_TOOLS)
+            for name, fn in _get_tool_map().items()
+        }
+    return _tool_registry
+
+
+def __getattr__(name: str):
+    # TOOL_MAP is kept as a compatibility alias over the registry source.
+    if name == "TOOL_MAP":
+        return _get_tool_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Tools that accept a `workspace` argument and require it to exist on disk.
 _WORKSPACE_TOOLS = {
@@ -101,14 +148,27 @@ _FROZEN_TOOLS = {
 }
 
 
+# Cached enforcement decision: (handshake epoch, dispatch allowed).
+# Revalidated with one integer compare per call; recomputed only when
+# run_handshake() publishes a new state.
+_enforce_cache: tuple[int, bool] | None = None
+
+
 def _enforce_contract_handshake(tool_name: str) -> None:
-    """Raise HTTP 503 if a frozen tool is called without a valid handshake."""
-    if tool_name not in _FROZEN_TOOLS:
-        return
-    if not is_frozen():
-        return
-    if is_handshake_valid():
-        return
+    """Raise HTTP 503 if a frozen tool is called without a valid handshake.
+
+    Callers gate on ToolEntry.is_frozen — only frozen tools reach here.
+    """
+    global _enforce_cache
+    epoch = state_epoch()
+    if _enforce_cache is not None and _enforce_cache[0] == epoch:
+        if _enforce_cache[1]:
+            return
+    else:
+        allowed = not is_frozen() or is_handshake_valid()
+        _enforce_cache = (epoch, allowed)
+        if allowed:
+            return
     status = handshake_status()
     raise HTTPException(
         status_code=503,
@@ -124,13 +184,24 @@ def _enforce_contract_handshake(tool_name: str) -> None:
     )
 
 
+def invalidate_workspace_cache() -> None:
+    """Drop the cached workspace-ID set (e.g. after creating a workspace)."""
+    invalidate_roots_cache()
+
+
 def _validate_workspace(tool_name: str, arguments: dict) -> None:
     """Raise HTTP 422 with structured payload if the workspace does not exist."""
-    workspace = arguments.get("workspace")
-    if workspace is None:
+    # Every tool in _WORKSPACE_TOOLS declares `workspace` as required, so
+    # the happy path is a plain subscript; EAFP keeps the missing-key case
+    # off the hot path entirely.
+    try:
+        workspace = arguments["workspace"]
+    except KeyError:
         return  # let downstream handle missing required param
-    available = get_available_workspaces()
-    ids = [w["id"] for w in available]
+    # The ID set is cached keyed on the root's mtime, so a workspace
+    # created since the last scan is picked up automatically and the
+    # common case costs one stat plus an O(1) membership check.
+    ids = get_workspace_ids()
     if workspace not in ids:
         raise HTTPException(
             status_code=422,
@@ -138,7 +209,7 @@ def _validate_workspace(tool_name: str, arguments: dict) -> None:
                 "tool": tool_name,
                 "args": arguments,
                 "reason": f"Workspace '{workspace}' not found",
-                "availableWorkspaces": ids,
+                "availableWorkspaces": sorted(ids),
             },
         )
 
@@ -147,22 +218,25 @@ def _validate_workspace(tool_name: str, arguments: dict) -> None:
 # Structured error helpers — never expose raw Python tracebacks
 # ---------------------------------------------------------------------------
 
+# Exception-name → structured error code. Built once; _classify_error is
+# on the error path of every dispatch.
+_ERROR_MAP = {
+    "FileNotFoundError": "FILE_NOT_FOUND",
+    "PermissionError": "PERMISSION_DENIED",
+    "TimeoutError": "TIMEOUT",
+    "ValueError": "INVALID_INPUT",
+    "TypeError": "INVALID_INPUT",
+    "KeyError": "MISSING_FIELD",
+    "IndexError": "INDEX_OUT_OF_RANGE",
+    "ConnectionError": "CONNECTION_ERROR",
+    "OSError": "IO_ERROR",
+    "RuntimeError": "RUNTIME_ERROR",
+}
+
+
 def _classify_error(exc: Exception) -> str:
     """Map a Python exception to a structured error code."""
-    name = type(exc).__name__
-    _ERROR_MAP = {
-        "FileNotFoundError": "FILE_NOT_FOUND",
-        "PermissionError": "PERMISSION_DENIED",
-        "TimeoutError": "TIMEOUT",
-        "ValueError": "INVALID_INPUT",
-        "TypeError": "INVALID_INPUT",
-        "KeyError": "MISSING_FIELD",
-        "IndexError": "INDEX_OUT_OF_RANGE",
-        "ConnectionError": "CONNECTION_ERROR",
-        "OSError": "IO_ERROR",
-        "RuntimeError": "RUNTIME_ERROR",
-    }
-    return _ERROR_MAP.get(name, "INTERNAL_ERROR")
+    return _ERROR_MAP.get(type(exc).__name__, "INTERNAL_ERROR")
 
 
 def _structured_error(tool_name: str, error_code: str, message: str) -> dict:
@@ -181,16 +255,22 @@ def _structured_error(tool_name: str, error_code: str, message: str) -> dict:
 
 
 def dispatch_tool_call(name: str, arguments: dict):
-    if name not in TOOL_MAP:
+    # Intern once at the JSON boundary: every internal table keys off the
+    # same interned literals, so the lookups below compare by identity
+    # instead of re-hashing the wire string each time.
+    name = sys.intern(name)
+    entry = _get_tool_registry().get(name)
+    if entry is None:
         return _structured_error(name, "UNKNOWN_TOOL", f"Unknown tool: {name}")
-    _enforce_contract_handshake(name)
-    if name in _WORKSPACE_TOOLS:
+    if entry.is_frozen:
+        _enforce_contract_handshake(name)
+    if entry.needs_workspace:
         _validate_workspace(name, arguments)
 
-    t0 = time.monotonic()
+    t0 = time.perf_counter_ns()
     try:
-        result = TOOL_MAP[name](**arguments)
-        duration_ms = (time.monotonic() - t0) * 1000
+        result = entry.fn(**arguments)
+        duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
         if isinstance(result, dict):
             result = stamp_response(result)
         log_tool_call(
@@ -200,11 +280,11 @@ def dispatch_tool_call(name: str, arguments: dict):
         )
         return result
     except HTTPException:
-        duration_ms = (time.monotonic() - t0) * 1000
+        duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
         log_tool_call(tool_name=name, ok=False, error_code="HTTP_EXCEPTION", duration_ms=duration_ms)
         raise
     except Exception as e:
-        duration_ms = (time.monotonic() - t0) * 1000
+        duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
         error_code = _classify_error(e)
         log_tool_call(tool_name=name, ok=False, error_code=error_code, duration_ms=duration_ms)
         return _structured_error(name, error_code, str(e))
@@ -1,21 +1,68 @@
 import os
+from functools import lru_cache
 
-WORKSPACE_ROOT = os.getenv("WORKSPACE_ROOT", "/workspaces")
+def get_workspace_root() -> str:
+    """Workspace root directory, read from the environment on each call.
+
+    Reading lazily (rather than capturing at import) lets the root be
+    repointed — e.g. per-test temp dirs — without reloading modules.
+    """
+    return os.getenv("WORKSPACE_ROOT", "/workspaces")
+
+
+@lru_cache(maxsize=64)
+def _workspace_base(root: str, workspace: str) -> str:
+    """Resolved base directory for a workspace (symlinks expanded)."""
+    return os.path.realpath(os.path.join(root, workspace))
+
+
+# Root-scan cache keyed by (root, st_mtime_ns): creating or removing a
+# workspace bumps the root directory's mtime, so repeat calls between
+# changes cost one stat instead of a listdir plus a stat per entry.
+# Stores (root, mtime_ns, workspaces, ids) — the frozenset serves O(1)
+# membership checks in the dispatcher's 422 validation.
+_roots_cache: tuple[str, int, list[dict], frozenset[str]] | None = None
+
+
+def invalidate_roots_cache() -> None:
+    """Drop the cached workspace scan (e.g. between tests)."""
+    global _roots_cache
+    _roots_cache = None
 
 
 def get_available_workspaces() -> list[dict]:
     """Return list of registered workspace IDs and their root paths (read-only)."""
-    root = WORKSPACE_ROOT
-    if not os.path.isdir(root):
+    global _roots_cache
+    root = get_workspace_root()
+    try:
+        mtime = os.stat(root).st_mtime_ns
+    except OSError:
         return []
+    if _roots_cache is not None and _roots_cache[0] == root and _roots_cache[1] == mtime:
+        return _roots_cache[2]
     workspaces = []
-    for name in sorted(os.listdir(root)):
-        full = os.path.join(root, name)
-        if os.path.isdir(full) and not name.startswith("."):
-            workspaces.append({"id": name, "root": full})
+    # scandir reuses the d_type info from the directory read, so the
+    # dir/hidden filtering needs no extra stat per entry.
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return []
+    for entry in entries:
+        if entry.is_dir() and not entry.name.startswith("."):
+            workspaces.append({"id": entry.name, "root": entry.path})
+    _roots_cache = (root, mtime, workspaces, frozenset(w["id"] for w in workspaces))
     return workspaces
 
 
+def get_workspace_ids() -> frozenset[str]:
+    """Frozenset of registered workspace IDs, cached with the scan above."""
+    get_available_workspaces()
+    if _roots_cache is None:
+        return frozenset()
+    return _roots_cache[3]
+
+
 def workspace_list_roots() -> dict:
     """Tier-0 read-only introspection: returns all registered workspace IDs + root paths."""
     workspaces = get_available_workspaces()
@@ -25,9 +72,12 @@ def workspace_list_roots() -> dict:
 def _abs(workspace: str, path: str) -> str:
     if "/" in workspace or ".." in workspace:
         raise ValueError("Invalid workspace")
-    base = os.path.join(WORKSPACE_ROOT, workspace)
-    full = os.path.normpath(os.path.join(base, path))
-    if not full.startswith(base):
+    base = _workspace_base(get_workspace_root(), workspace)
+    full = os.path.realpath(os.path.join(base, path))
+    # commonpath is component-wise, so "/ws/foo-evil" can no longer alias
+    # "/ws/foo" the way a plain startswith prefix test allowed, and
+    # realpath closes symlink escapes.
+    if os.path.commonpath([full, base]) != base:
         raise ValueError("Path traversal blocked")
     return full
 
@@ -37,20 +87,42 @@ def workspace_list(workspace: str, path: str = "."):
     if not os.path.exists(full):
         return {"ok": False, "error": "path not found"}
     items = []
-    for name in sorted(os.listdir(full)):
-        p = os.path.join(full, name)
-        items.append({
-            "name": name,
-            "is_dir": os.path.isdir(p),
-            "size": os.path.getsize(p) if os.path.isfile(p) else None
-        })
+    # scandir reuses the d_type/stat info returned by the directory read,
+    # so each entry costs at most one stat (for file sizes) instead of
+    # three (isdir + isfile + getsize).
+    with os.scandir(full) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            is_file = entry.is_file(follow_symlinks=False)
+            items.append({
+                "name": entry.name,
+                "is_dir": entry.is_dir(follow_symlinks=False),
+                "size": entry.stat(follow_symlinks=False).st_size if is_file else None
+            })
     return {"ok": True, "path": path, "items": items}
 
 def workspace_read(workspace: str, path: str, max_bytes: int = 200000):
     full = _abs(workspace, path)
-    if not os.path.isfile(full):
+    # Open directly instead of isfile-then-open: one syscall fewer, no
+    # check/open race, and O_NOFOLLOW makes the kernel reject a symlink
+    # swapped in as the last path component.
+    try:
+        fd = os.open(full, os.O_RDONLY | os.O_NOFOLLOW | os.O_CLOEXEC)
+    except OSError:
+        return {"ok": False, "error": "file not found"}
+    try:
+        chunks = []
+        remaining = max_bytes + 1
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b"".join(chunks)
+    except OSError:  # e.g. reading a directory
         return {"ok": False, "error": "file not found"}
-    data = open(full, "rb").read(max_bytes + 1)
+    finally:
+        os.close(fd)
     if len(data) > max_bytes:
         return {"ok": False, "error": f"file too large > {max_bytes} bytes"}
     return {"ok": True, "path": path, "content": data.decode("utf-8", errors="replace")}
@@ -60,6 +132,9 @@ def workspace_write(workspace: str, path: str, content: str, mkdirs: bool = True
     d = os.path.dirname(full)
     if mkdirs:
         os.makedirs(d, exist_ok=True)
-    with open(full, "w", encoding="utf-8") as f:
-        f.write(content)
-    return {"ok": True, "path": path, "bytes": len(content.encode("utf-8"))}
+    # Encode once and write binary — the text-mode path re-encoded the
+    # full content a second time just to report its byte length.
+    buf = content.encode("utf-8")
+    with open(full, "wb") as f:
+        f.write(buf)
+    return {"ok": True, "path": path, "bytes": len(buf)}
@@ -0,0 +1,19 @@
+"""Shared pytest configuration for the router test suite."""
+
+import httpx
+import orjson
+import pytest
+
+
+# TestClient responses are decoded with stdlib json by default; the
+# detector and parser payloads are large lists of small dicts, which
+# orjson decodes several times faster. Patched once for the session.
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_response_json():
+    def _json(self, **kwargs):
+        return orjson.loads(self.content)
+
+    original = httpx.Response.json
+    httpx.Response.json = _json
+    yield
+    httpx.Response.json = original
@@ -24,15 +24,19 @@ from fastapi.testclient import TestClient
 
 # ---- Fixtures ----
 
-@pytest.fixture(autouse=True)
-def _workspace_root(tmp_path, monkeypatch):
-    ws_root = tmp_path / "workspaces"
-    ws_root.mkdir()
+# Session-scoped: the env vars never change between tests in this module,
+# and reloading six modules (including the jsonschema validator build and
+# schema hashing) per test dominated suite wall time. One reload pass
+# serves every test here.
+@pytest.fixture(scope="session", autouse=True)
+def _workspace_root(tmp_path_factory):
+    ws_root = tmp_path_factory.mktemp("workspaces")
     ws_dir = ws_root / "contract-proj"
     ws_dir.mkdir()
 
-    monkeypatch.setenv("WORKSPACE_ROOT", str(ws_root))
-    monkeypatch.setenv("ROUTER_AUTH_TOKEN", "")
+    saved = {k: os.environ.get(k) for k in ("WORKSPACE_ROOT", "ROUTER_AUTH_TOKEN")}
+    os.environ["WORKSPACE_ROOT"] = str(ws_root)
+    os.environ["ROUTER_AUTH_TOKEN"] = ""
 
     from router.app import workspace_tools, blueprint_parse_tools, blueprint_detect_tools, tools, main
     from router.app.contracts.blueprint import validate_blueprint_parse
@@ -45,25 +49,29 @@ def _workspace_root(tmp_path, monkeypatch):
 
     yield str(ws_root)
 
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
 
 @pytest.fixture()
 def ws_dir(_workspace_root):
     return os.path.join(_workspace_root, "contract-proj")
 
 
-@pytest.fixture()
-def client():
+# Module-scoped: the app is reloaded once per session (fixture above),
+# so the ASGI test transport can be built once instead of per test.
+@pytest.fixture(scope="module")
+def client(_workspace_root):
     from router.app.main import app
     return TestClient(app, raise_server_exceptions=False)
 
 
-@pytest.fixture()
-def sample_pdf(ws_dir):
-    """Create a minimal blueprint PDF."""
-    filename = "plans/test.pdf"
-    full = os.path.join(ws_dir, filename)
-    os.makedirs(os.path.dirname(full), exist_ok=True)
-
+@pytest.fixture(scope="session")
+def _sample_pdf_bytes():
+    """Serialize the test blueprint PDF once; tests just write the bytes."""
     doc = fitz.open()
     page = doc.new_page(width=792, height=612)
     page.insert_text((72, 72), "TEST ELECTRICAL PLAN E-001", fontsize=14)
@@ -82,8 +90,19 @@ def sample_pdf(ws_dir):
         "Drawing No: E-001\nSheet No: 1\nScale: NTS\nDate: 2024-01-01",
         fontsize=7,
     )
-    doc.save(full)
+    data = doc.tobytes()
     doc.close()
+    return data
+
+
+@pytest.fixture()
+def sample_pdf(ws_dir, _sample_pdf_bytes):
+    """Create a minimal blueprint PDF."""
+    filename = "plans/test.pdf"
+    full = os.path.join(ws_dir, filename)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, "wb") as f:
+        f.write(_sample_pdf_bytes)
     return filename
 
 
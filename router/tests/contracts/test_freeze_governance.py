@@ -38,6 +38,15 @@ from contracts.governance import (
 )
 from contracts.blueprint.validate_blueprint_parse import get_schema_hash
 
+# Contract file locations, resolved once for the whole module.
+_APP_DIR = Path(__file__).resolve().parents[2] / "app"
+_SCHEMA_PATH = _APP_DIR / "contracts" / "blueprint" / "BlueprintParseV1.schema.json"
+_FREEZE_PATH = _APP_DIR / "contracts" / "IBEW_LV_V1.freeze.json"
+
+# Compiled once; assertRegex accepts precompiled patterns.
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 # ===================================================================
 # Freeze Manifest Structure
@@ -46,33 +55,38 @@ from contracts.blueprint.validate_blueprint_parse import get_schema_hash
 class TestFreezeManifest(unittest.TestCase):
     """Test the freeze manifest file is correct and complete."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Loaded once for the class — every test reads the same manifest.
+        cls.m = get_manifest()
+
     def test_manifest_loads(self):
-        m = get_manifest()
+        m = self.m
         self.assertIsInstance(m, dict)
         self.assertIn("vertex", m)
 
     def test_manifest_vertex(self):
-        m = get_manifest()
+        m = self.m
         self.assertEqual(m["vertex"], "IBEW_LV")
 
     def test_manifest_version(self):
-        m = get_manifest()
+        m = self.m
         self.assertEqual(m["version"], "1.0.0")
         # semver pattern
-        self.assertRegex(m["version"], r"^\d+\.\d+\.\d+$")
+        self.assertRegex(m["version"], _SEMVER_RE)
 
     def test_manifest_status_frozen(self):
-        m = get_manifest()
+        m = self.m
         self.assertEqual(m["status"], "frozen")
 
     def test_manifest_frozen_at(self):
-        m = get_manifest()
+        m = self.m
         self.assertEqual(m["frozen_at"], "2026-02-15")
         # ISO date pattern
-        self.assertRegex(m["frozen_at"], r"^\d{4}-\d{2}-\d{2}$")
+        self.assertRegex(m["frozen_at"], _ISO_DATE_RE)
 
     def test_manifest_has_contracts(self):
-        m = get_manifest()
+        m = self.m
         contracts = m.get("contracts", [])
         self.assertGreaterEqual(len(contracts), 2)
         names = [c["name"] for c in contracts]
@@ -80,32 +94,32 @@ class TestFreezeManifest(unittest.TestCase):
         self.assertIn("EstimateChainV1", names)
 
     def test_all_contracts_locked(self):
-        m = get_manifest()
+        m = self.m
         for c in m["contracts"]:
             self.assertEqual(c["status"], "locked", f"{c['name']} should be locked")
 
     def test_manifest_has_intelligence(self):
-        m = get_manifest()
+        m = self.m
         self.assertIn("intelligence", m)
         self.assertEqual(m["intelligence"]["status"], "locked")
 
     def test_manifest_has_outputs(self):
-        m = get_manifest()
+        m = self.m
         self.assertIn("outputs", m)
         self.assertEqual(m["outputs"]["status"], "locked")
 
     def test_manifest_has_prohibited_actions(self):
-        m = get_manifest()
+        m = self.m
         prohibited = m.get("prohibited_until_v2", [])
         self.assertGreaterEqual(len(prohibited), 5)
 
     def test_manifest_has_allowed_actions(self):
-        m = get_manifest()
+        m = self.m
         allowed = m.get("allowed_after_freeze", [])
         self.assertGreaterEqual(len(allowed), 5)
 
     def test_manifest_has_governance_rules(self):
-        m = get_manifest()
+        m = self.m
         self.assertIn("governance", m)
         self.assertIn("change_request_types", m["governance"])
         self.assertIn("rule", m["governance"])
@@ -125,8 +139,12 @@ class TestFreezeManifest(unittest.TestCase):
 class TestVertexStamp(unittest.TestCase):
     """Test the vertex stamp block for API responses."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.stamp = get_vertex_stamp()
+
     def test_stamp_structure(self):
-        stamp = get_vertex_stamp()
+        stamp = self.stamp
         self.assertEqual(stamp["vertex"], "IBEW_LV")
         self.assertEqual(stamp["version"], "1.0.0")
         self.assertEqual(stamp["status"], "frozen")
@@ -135,12 +153,12 @@ class TestVertexStamp(unittest.TestCase):
         self.assertIn("manifest_hash", stamp)
 
     def test_stamp_contracts_list(self):
-        stamp = get_vertex_stamp()
+        stamp = self.stamp
         self.assertIn("BlueprintParseV1", stamp["contracts"])
         self.assertIn("EstimateChainV1", stamp["contracts"])
 
     def test_stamp_manifest_hash_matches(self):
-        stamp = get_vertex_stamp()
+        stamp = self.stamp
         self.assertEqual(stamp["manifest_hash"], get_manifest_hash())
 
     def test_stamp_is_deterministic(self):
@@ -209,8 +227,7 @@ class TestSchemaIntegrity(unittest.TestCase):
 
     def test_schema_file_untampered(self):
         """Verify the schema file on disk matches the registered hash."""
-        schema_path = Path(__file__).parent.parent.parent / "app" / "contracts" / "blueprint" / "BlueprintParseV1.schema.json"
-        actual_hash = hashlib.sha256(schema_path.read_bytes()).hexdigest()
+        actual_hash = hashlib.sha256(_SCHEMA_PATH.read_bytes()).hexdigest()
         registered_hash = get_schema_hash()
         self.assertEqual(actual_hash, registered_hash)
 
@@ -335,20 +352,22 @@ class TestToolVertexIntegration(unittest.TestCase):
 class TestFreezeFileIntegrity(unittest.TestCase):
     """Test the freeze manifest file itself."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.m = get_manifest()
+
     def test_json_valid(self):
-        freeze_path = Path(__file__).parent.parent.parent / "app" / "contracts" / "IBEW_LV_V1.freeze.json"
-        raw = freeze_path.read_text()
+        raw = _FREEZE_PATH.read_bytes()
         data = json.loads(raw)
         self.assertIsInstance(data, dict)
 
     def test_file_hash_matches_module(self):
-        freeze_path = Path(__file__).parent.parent.parent / "app" / "contracts" / "IBEW_LV_V1.freeze.json"
-        file_hash = hashlib.sha256(freeze_path.read_bytes()).hexdigest()
+        file_hash = hashlib.sha256(_FREEZE_PATH.read_bytes()).hexdigest()
         module_hash = get_manifest_hash()
         self.assertEqual(file_hash, module_hash)
 
     def test_gap_detection_rules_declared(self):
-        m = get_manifest()
+        m = self.m
         intel = m["intelligence"]
         gap_component = None
         for comp in intel["components"]:
@@ -359,7 +378,7 @@ class TestFreezeFileIntegrity(unittest.TestCase):
         self.assertEqual(gap_component["rules_locked"], ["G1", "G2", "G3", "G4", "G5", "G6"])
 
     def test_model_registry_frozen(self):
-        m = get_manifest()
+        m = self.m
         intel = m["intelligence"]
         model_component = None
         for comp in intel["components"]:
@@ -372,7 +391,7 @@ class TestFreezeFileIntegrity(unittest.TestCase):
         self.assertIn("yolov8m-blueprint-v3", model_component["locked_models"])
 
     def test_output_formats_frozen(self):
-        m = get_manifest()
+        m = self.m
         outputs = m["outputs"]
         format_names = [f["name"] for f in outputs["formats"]]
         self.assertIn("excel_export", format_names)
@@ -386,17 +405,20 @@ class TestFreezeFileIntegrity(unittest.TestCase):
 class TestCrossModuleConsistency(unittest.TestCase):
     """Test that frozen values are consistent across modules."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.m = get_manifest()
+
     def test_contract_name_matches_schema(self):
         """BlueprintParseV1 contract name in governance matches schema $id."""
-        schema_path = Path(__file__).parent.parent.parent / "app" / "contracts" / "blueprint" / "BlueprintParseV1.schema.json"
-        schema = json.loads(schema_path.read_text())
+        schema = json.loads(_SCHEMA_PATH.read_text())
         locked = get_locked_contracts()
         self.assertIn(schema["$id"], locked)
 
     def test_model_registry_models_match_frozen_list(self):
         """Model registry models match the frozen manifest's locked_models."""
         from model_registry import list_models
-        m = get_manifest()
+        m = self.m
         model_component = next(
             c for c in m["intelligence"]["components"]
             if c["name"] == "symbol_detection_model_registry"
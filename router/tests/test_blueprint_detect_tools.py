@@ -14,19 +14,50 @@ Validates:
 import importlib
 import json
 import os
+import re
+import shutil
 
 import fitz  # PyMuPDF
 import pytest
 from fastapi.testclient import TestClient
 
+_SEMVER_RE = re.compile(r"\d+\.\d+\.\d+")
+
 
 # ---- Sample PDF builders (same 3 as parse tests) ----
 
-def _create_electrical_pdf(ws_dir: str, filename: str = "plans/electrical.pdf") -> str:
-    """Sample 1: Electrical plan with LV devices."""
+# The sample PDFs are pure functions of their name, so each is rendered
+# with fitz only once per process; later tests just write the cached bytes.
+_PDF_BYTES: dict[str, bytes] = {}
+_PDF_PATHS: dict[str, str] = {}
+
+
+def _write_sample_pdf(ws_dir: str, filename: str, build) -> str:
     full = os.path.join(ws_dir, filename)
+    if os.path.exists(full):
+        return filename
     os.makedirs(os.path.dirname(full), exist_ok=True)
+    src = _PDF_PATHS.get(filename)
+    if src is not None and os.path.exists(src):
+        # Identical bytes already on disk: hardlink instead of rewriting.
+        try:
+            os.link(src, full)
+        except OSError:
+            shutil.copyfile(src, full)
+    else:
+        if filename not in _PDF_BYTES:
+            _PDF_BYTES[filename] = build()
+        with open(full, "wb") as f:
+            f.write(_PDF_BYTES[filename])
+        _PDF_PATHS[filename] = full
+    return filename
+
+def _create_electrical_pdf(ws_dir: str, filename: str = "plans/electrical.pdf") -> str:
+    """Sample 1: Electrical plan with LV devices."""
+    return _write_sample_pdf(ws_dir, filename, _build_electrical_pdf)
+
 
+def _build_electrical_pdf() -> bytes:
     doc = fitz.open()
     page1 = doc.new_page(width=792, height=612)
     page1.insert_text((72, 72), "ELECTRICAL PLAN E-101", fontsize=14)
@@ -59,16 +90,17 @@ def _create_electrical_pdf(ws_dir: str, filename: str = "plans/electrical.pdf")
         fontsize=10,
     )
 
-    doc.save(full)
+    data = doc.tobytes()
     doc.close()
-    return filename
+    return data
 
 
 def _create_security_pdf(ws_dir: str, filename: str = "plans/security.pdf") -> str:
     """Sample 2: Security system plan."""
-    full = os.path.join(ws_dir, filename)
-    os.makedirs(os.path.dirname(full), exist_ok=True)
+    return _write_sample_pdf(ws_dir, filename, _build_security_pdf)
 
+
+def _build_security_pdf() -> bytes:
     doc = fitz.open()
     page1 = doc.new_page(width=792, height=612)
     page1.insert_text((72, 72), "SECURITY SYSTEM PLAN S-001", fontsize=14)
@@ -90,16 +122,17 @@ def _create_security_pdf(ws_dir: str, filename: str = "plans/security.pdf") -> s
         fontsize=10,
     )
 
-    doc.save(full)
+    data = doc.tobytes()
     doc.close()
-    return filename
+    return data
 
 
 def _create_lowvoltage_pdf(ws_dir: str, filename: str = "plans/lowvoltage.pdf") -> str:
     """Sample 3: Multi-page low-voltage plan."""
-    full = os.path.join(ws_dir, filename)
-    os.makedirs(os.path.dirname(full), exist_ok=True)
+    return _write_sample_pdf(ws_dir, filename, _build_lowvoltage_pdf)
+
 
+def _build_lowvoltage_pdf() -> bytes:
     doc = fitz.open()
 
     p1 = doc.new_page(width=792, height=612)
@@ -138,22 +171,26 @@ def _create_lowvoltage_pdf(ws_dir: str, filename: str = "plans/lowvoltage.pdf")
         fontsize=10,
     )
 
-    doc.save(full)
+    data = doc.tobytes()
     doc.close()
-    return filename
+    return data
 
 
 # ---- Fixtures ----
 
-@pytest.fixture(autouse=True)
-def _workspace_root(tmp_path, monkeypatch):
-    ws_root = tmp_path / "workspaces"
-    ws_root.mkdir()
+# Session-scoped: the env never changes between tests in this module, and
+# reloading five modules (schema loads, hash registration) per test was
+# the dominant setup cost once the PDFs were cached. One reload pass
+# serves every test here.
+@pytest.fixture(scope="session", autouse=True)
+def _workspace_root(tmp_path_factory):
+    ws_root = tmp_path_factory.mktemp("detect-workspaces")
     ws_dir = ws_root / "detect-proj"
     ws_dir.mkdir()
 
-    monkeypatch.setenv("WORKSPACE_ROOT", str(ws_root))
-    monkeypatch.setenv("ROUTER_AUTH_TOKEN", "")
+    saved = {k: os.environ.get(k) for k in ("WORKSPACE_ROOT", "ROUTER_AUTH_TOKEN")}
+    os.environ["WORKSPACE_ROOT"] = str(ws_root)
+    os.environ["ROUTER_AUTH_TOKEN"] = ""
 
     from router.app import (
         workspace_tools, blueprint_detect_tools, model_registry, tools, main
@@ -166,14 +203,22 @@ def _workspace_root(tmp_path, monkeypatch):
 
     yield str(ws_root)
 
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
 
 @pytest.fixture()
 def ws_dir(_workspace_root):
     return os.path.join(_workspace_root, "detect-proj")
 
 
-@pytest.fixture()
-def client():
+# Module-scoped: the app is reloaded once per session (fixture above),
+# so the ASGI test transport can be built once instead of per test.
+@pytest.fixture(scope="module")
+def client(_workspace_root):
     from router.app.main import app
     return TestClient(app, raise_server_exceptions=False)
 
@@ -194,7 +239,14 @@ def lowvoltage_pdf(ws_dir):
 
 
 def _call_detect(client, pdf_path, **extra):
-    args = {"workspace": "detect-proj", "pdf_path": pdf_path}
+    # Overlays are rendered per page with PIL; only the overlay tests
+    # assert on them, so everything else skips that cost.
+    args = {
+        "workspace": "detect-proj",
+        "pdf_path": pdf_path,
+        "dpi": 72,
+        "include_overlays": False,
+    }
     args.update(extra)
     return client.post("/tool", json={
         "tool_call": {"name": "blueprint_detect_symbols", "arguments": args}
@@ -227,10 +279,10 @@ class TestDetectionSchema:
 
         assert body["ok"] is True
         assert body["schema_version"] == "SymbolDetectionV1"
-        assert self.REQUIRED_TOP_KEYS.issubset(set(body.keys()))
+        assert self.REQUIRED_TOP_KEYS <= body.keys()
 
         # Model info
-        assert self.REQUIRED_MODEL_KEYS.issubset(set(body["model"].keys()))
+        assert self.REQUIRED_MODEL_KEYS <= body["model"].keys()
 
         # Summary
         assert "total_detections" in body["summary"]
@@ -242,14 +294,14 @@ class TestDetectionSchema:
         assert isinstance(body["detections"], list)
         assert len(body["detections"]) > 0
         for det in body["detections"]:
-            assert self.REQUIRED_DETECTION_KEYS.issubset(set(det.keys()))
+            assert self.REQUIRED_DETECTION_KEYS <= det.keys()
 
     def test_security_schema(self, client, security_pdf):
         resp = _call_detect(client, security_pdf)
         body = resp.json()
         assert body["ok"] is True
         assert body["schema_version"] == "SymbolDetectionV1"
-        assert self.REQUIRED_TOP_KEYS.issubset(set(body.keys()))
+        assert self.REQUIRED_TOP_KEYS <= body.keys()
 
     def test_multipage_schema(self, client, lowvoltage_pdf):
         resp = _call_detect(client, lowvoltage_pdf)
@@ -264,38 +316,44 @@ class TestDetectionSchema:
 # =====================================================================
 
 class TestDetectionFields:
-    def test_bbox_format(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
+    # The five electrical-PDF tests assert on different fields of the same
+    # detect output, so the endpoint is called once per class instead of
+    # once per test.
+    @pytest.fixture(scope="class")
+    def electrical_resp(self, _workspace_root):
+        from router.app.main import app
+        ws_dir = os.path.join(_workspace_root, "detect-proj")
+        pdf = _create_electrical_pdf(ws_dir)
+        client = TestClient(app, raise_server_exceptions=False)
+        return _call_detect(client, pdf)
+
+    def test_bbox_format(self, electrical_resp):
+        body = electrical_resp.json()
         for det in body["detections"]:
             bbox = det["bbox"]
             assert isinstance(bbox, list)
             assert len(bbox) == 4
             assert all(isinstance(v, (int, float)) for v in bbox)
 
-    def test_confidence_range(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
+    def test_confidence_range(self, electrical_resp):
+        body = electrical_resp.json()
         for det in body["detections"]:
             assert 0.0 <= det["confidence"] <= 1.0
 
-    def test_class_is_string(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
+    def test_class_is_string(self, electrical_resp):
+        body = electrical_resp.json()
         for det in body["detections"]:
             assert isinstance(det["class"], str)
             assert len(det["class"]) > 0
 
-    def test_model_version_present(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
+    def test_model_version_present(self, electrical_resp):
+        body = electrical_resp.json()
         for det in body["detections"]:
             assert isinstance(det["model_version"], str)
             assert len(det["model_version"]) > 0
 
-    def test_detects_expected_classes(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
+    def test_detects_expected_classes(self, electrical_resp):
+        body = electrical_resp.json()
         detected_classes = {det["class"] for det in body["detections"]}
         # Electrical PDF has data drops, APs, cameras, card readers, etc.
         assert "data_drop" in detected_classes
@@ -350,11 +408,16 @@ class TestOverlayImages:
 # =====================================================================
 
 class TestModelRegistry:
-    def test_list_models_returns_three(self, client):
-        resp = client.post("/tool", json={
+    # The registry is static, so the four read-only tests below share one
+    # blueprint_list_models response instead of re-posting identical args.
+    @pytest.fixture(scope="class")
+    def list_models_resp(self, client):
+        return client.post("/tool", json={
             "tool_call": {"name": "blueprint_list_models", "arguments": {}}
         })
-        body = resp.json()
+
+    def test_list_models_returns_three(self, list_models_resp):
+        body = list_models_resp.json()
         assert body["ok"] is True
         assert body["model_count"] == 3
         assert len(body["models"]) == 3
@@ -363,12 +426,8 @@ class TestModelRegistry:
         assert "yolov8s-blueprint-v2" in model_ids
         assert "yolov8m-blueprint-v3" in model_ids
 
-    def test_model_has_required_fields(self, client):
-        resp = client.post("/tool", json={
-            "tool_call": {"name": "blueprint_list_models", "arguments": {}}
-        })
-        body = resp.json()
-        for model in body["models"]:
+    def test_model_has_required_fields(self, list_models_resp):
+        for model in list_models_resp.json()["models"]:
             assert "model_id" in model
             assert "version" in model
             assert "architecture" in model
@@ -381,21 +440,12 @@ class TestModelRegistry:
             assert isinstance(model["classes"], list)
             assert model["class_count"] == len(model["classes"])
 
-    def test_active_model_defaults_to_v1(self, client):
-        resp = client.post("/tool", json={
-            "tool_call": {"name": "blueprint_list_models", "arguments": {}}
-        })
-        body = resp.json()
-        assert body["active_model_id"] == "yolov8n-blueprint-v1"
+    def test_active_model_defaults_to_v1(self, list_models_resp):
+        assert list_models_resp.json()["active_model_id"] == "yolov8n-blueprint-v1"
 
-    def test_model_versions_are_semver(self, client):
-        resp = client.post("/tool", json={
-            "tool_call": {"name": "blueprint_list_models", "arguments": {}}
-        })
-        body = resp.json()
-        import re
-        for model in body["models"]:
-            assert re.match(r"\d+\.\d+\.\d+", model["version"])
+    def test_model_versions_are_semver(self, list_models_resp):
+        for model in list_models_resp.json()["models"]:
+            assert _SEMVER_RE.match(model["version"])
 
     def test_per_class_thresholds(self):
         from router.app.model_registry import get_model
@@ -434,31 +484,53 @@ class TestModelRegistry:
 # =====================================================================
 
 class TestThreeSamplePDFs:
-    def test_electrical_stable_output(self, client, electrical_pdf, ws_dir):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
+    EXPECTED_TOP_KEYS = frozenset({
+        "ok", "schema_version", "detection_id", "generated_at",
+        "pdf_path", "page_count", "model", "summary",
+        "detections", "page_summaries", "artifacts",
+    })
+
+    # The four tests below exercise the same three PDFs, so detect runs
+    # once per PDF for the whole class and the responses are shared.
+    @pytest.fixture(scope="class")
+    def detect_results(self, _workspace_root):
+        from router.app.main import app
+        ws_dir = os.path.join(_workspace_root, "detect-proj")
+        client = TestClient(app, raise_server_exceptions=False)
+        return {
+            pdf: _call_detect(client, pdf)
+            for pdf in (
+                _create_electrical_pdf(ws_dir),
+                _create_security_pdf(ws_dir),
+                _create_lowvoltage_pdf(ws_dir),
+            )
+        }
+
+    def test_electrical_stable_output(self, detect_results, electrical_pdf, ws_dir):
+        body = detect_results[electrical_pdf].json()
         assert body["ok"] is True
         assert body["page_count"] == 2
         assert body["summary"]["total_detections"] > 0
         assert body["summary"]["unique_classes"] > 0
-        # Artifacts on disk
+        # Artifacts on disk — one readdir per directory, not a stat apiece
+        present: dict[str, set] = {}
         for a in body["artifacts"]:
             if a["type"] != "detection_json":
-                full = os.path.join(ws_dir, a["path"])
-                assert os.path.isfile(full), f"Artifact missing: {full}"
+                art_dir, name = os.path.split(os.path.join(ws_dir, a["path"]))
+                if art_dir not in present:
+                    present[art_dir] = {e.name for e in os.scandir(art_dir)}
+                assert name in present[art_dir], f"Artifact missing: {a['path']}"
 
-    def test_security_stable_output(self, client, security_pdf, ws_dir):
-        resp = _call_detect(client, security_pdf)
-        body = resp.json()
+    def test_security_stable_output(self, detect_results, security_pdf, ws_dir):
+        body = detect_results[security_pdf].json()
         assert body["ok"] is True
         assert body["page_count"] == 1
         assert body["summary"]["total_detections"] > 0
         detected_classes = set(body["summary"]["class_counts"].keys())
         assert "card_reader" in detected_classes
 
-    def test_lowvoltage_stable_output(self, client, lowvoltage_pdf, ws_dir):
-        resp = _call_detect(client, lowvoltage_pdf)
-        body = resp.json()
+    def test_lowvoltage_stable_output(self, detect_results, lowvoltage_pdf, ws_dir):
+        body = detect_results[lowvoltage_pdf].json()
         assert body["ok"] is True
         assert body["page_count"] == 3
         assert body["summary"]["total_detections"] > 0
@@ -470,19 +542,11 @@ class TestThreeSamplePDFs:
             assert "classes_found" in ps
             assert isinstance(ps["classes_found"], list)
 
-    def test_all_three_produce_consistent_schema(
-        self, client, electrical_pdf, security_pdf, lowvoltage_pdf
-    ):
+    def test_all_three_produce_consistent_schema(self, detect_results):
         """All 3 PDFs produce the same top-level schema keys."""
-        expected_keys = {
-            "ok", "schema_version", "detection_id", "generated_at",
-            "pdf_path", "page_count", "model", "summary",
-            "detections", "page_summaries", "artifacts",
-        }
-        for pdf in [electrical_pdf, security_pdf, lowvoltage_pdf]:
-            resp = _call_detect(client, pdf)
+        for resp in detect_results.values():
             body = resp.json()
-            assert expected_keys.issubset(set(body.keys()))
+            assert self.EXPECTED_TOP_KEYS <= body.keys()
             assert body["schema_version"] == "SymbolDetectionV1"
 
 
@@ -516,39 +580,38 @@ class TestWorkspaceValidation:
 # =====================================================================
 
 class TestNeverNullContent:
-    def test_detections_never_null(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
-        assert body["detections"] is not None
-        assert isinstance(body["detections"], list)
-
-    def test_page_summaries_never_null(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
-        assert body["page_summaries"] is not None
+    # All assertions here read the same detect output, so the endpoint is
+    # called once for the class and the response shared.
+    @pytest.fixture(scope="class")
+    def electrical_resp(self, _workspace_root):
+        from router.app.main import app
+        ws_dir = os.path.join(_workspace_root, "detect-proj")
+        pdf = _create_electrical_pdf(ws_dir)
+        client = TestClient(app, raise_server_exceptions=False)
+        return _call_detect(client, pdf)
+
+    @pytest.mark.parametrize("key,typ", [
+        ("detections", list),
+        ("page_summaries", list),
+        ("artifacts", list),
+        ("model", dict),
+        ("summary", dict),
+    ])
+    def test_key_never_null(self, electrical_resp, key, typ):
+        value = electrical_resp.json()[key]
+        assert value is not None
+        assert isinstance(value, typ)
+
+    def test_nested_fields_never_null(self, electrical_resp):
+        body = electrical_resp.json()
         for ps in body["page_summaries"]:
             assert ps["class_counts"] is not None
             assert ps["classes_found"] is not None
-
-    def test_artifacts_never_null(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
-        assert body["artifacts"] is not None
         for a in body["artifacts"]:
             assert a["type"] is not None
             assert a["path"] is not None
-
-    def test_model_info_never_null(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
-        assert body["model"] is not None
         assert body["model"]["model_id"] is not None
         assert body["model"]["version"] is not None
-
-    def test_summary_never_null(self, client, electrical_pdf):
-        resp = _call_detect(client, electrical_pdf)
-        body = resp.json()
-        assert body["summary"] is not None
         assert body["summary"]["class_counts"] is not None
 
 
@@ -557,18 +620,19 @@ class TestNeverNullContent:
 # =====================================================================
 
 class TestToolRegistration:
-    def test_detect_symbols_registered(self, client):
+    # The registry is immutable after module load, so the /tools listing
+    # is fetched and indexed once per class.
+    @pytest.fixture(scope="class")
+    def tools_by_name(self, client):
         resp = client.get("/tools")
         assert resp.status_code == 200
-        names = [t["function"]["name"] for t in resp.json()["tools"]]
-        assert "blueprint_detect_symbols" in names
-        assert "blueprint_list_models" in names
+        return {t["function"]["name"]: t["function"] for t in resp.json()["tools"]}
 
-    def test_detect_symbols_has_required_params(self, client):
-        resp = client.get("/tools")
-        tools_by_name = {
-            t["function"]["name"]: t["function"] for t in resp.json()["tools"]
-        }
+    def test_detect_symbols_registered(self, tools_by_name):
+        assert "blueprint_detect_symbols" in tools_by_name
+        assert "blueprint_list_models" in tools_by_name
+
+    def test_detect_symbols_has_required_params(self, tools_by_name):
         detect = tools_by_name["blueprint_detect_symbols"]
         assert "workspace" in detect["parameters"]["required"]
         assert "pdf_path" in detect["parameters"]["required"]
@@ -10,9 +10,9 @@ Validates:
   - Workspace validation (422) applies to blueprint tools
 """
 
-import importlib
 import json
 import os
+import shutil
 import zipfile
 
 import fitz  # PyMuPDF — used to create sample PDFs
@@ -24,6 +24,9 @@ from fastapi.testclient import TestClient
 
 # ---- Fixtures ----
 
+# The app reads WORKSPACE_ROOT lazily (workspace_tools.get_workspace_root),
+# so repointing the root is just a setenv — no module reloads. Only the
+# workspace-ID cache in the dispatcher needs dropping between tests.
 @pytest.fixture(autouse=True)
 def _workspace_root(tmp_path, monkeypatch):
     """Set up a temp WORKSPACE_ROOT with a sample workspace + PDF."""
@@ -35,11 +38,8 @@ def _workspace_root(tmp_path, monkeypatch):
     monkeypatch.setenv("WORKSPACE_ROOT", str(ws_root))
     monkeypatch.setenv("ROUTER_AUTH_TOKEN", "")
 
-    from router.app import workspace_tools, blueprint_tools, tools, main
-    importlib.reload(workspace_tools)
-    importlib.reload(blueprint_tools)
-    importlib.reload(tools)
-    importlib.reload(main)
+    from router.app import tools
+    tools.invalidate_workspace_cache()
 
     yield str(ws_root)
 
@@ -49,37 +49,62 @@ def ws_dir(_workspace_root):
     return os.path.join(_workspace_root, "blueprint-proj")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client():
     from router.app.main import app
     return TestClient(app, raise_server_exceptions=False)
 
 
-def _create_sample_pdf(ws_dir: str, filename: str = "plans/floor1.pdf") -> str:
-    """Create a sample blueprint-like PDF with low-voltage device references."""
+# The sample PDF is deterministic, so it is rendered with fitz only once
+# per process; later tests hardlink (or copy) the first on-disk copy.
+_PDF_BYTES: dict[str, bytes] = {}
+_PDF_PATHS: dict[str, str] = {}
+
+
+def _write_sample_pdf(ws_dir: str, filename: str, build) -> str:
     full = os.path.join(ws_dir, filename)
+    if os.path.exists(full):
+        return filename
     os.makedirs(os.path.dirname(full), exist_ok=True)
+    src = _PDF_PATHS.get(filename)
+    if src is not None and os.path.exists(src):
+        try:
+            os.link(src, full)
+        except OSError:
+            shutil.copyfile(src, full)
+    else:
+        if filename not in _PDF_BYTES:
+            _PDF_BYTES[filename] = build()
+        with open(full, "wb") as f:
+            f.write(_PDF_BYTES[filename])
+        _PDF_PATHS[filename] = full
+    return filename
+
 
+def _create_sample_pdf(ws_dir: str, filename: str = "plans/floor1.pdf") -> str:
+    """Create a sample blueprint-like PDF with low-voltage device references."""
+    return _write_sample_pdf(ws_dir, filename, _build_sample_pdf)
+
+
+def _build_sample_pdf() -> bytes:
     doc = fitz.open()
 
+    # One insert_text per page: each call re-resolves the font and emits a
+    # separate content-stream fragment, and the tests only assert on text
+    # content, never on font size or block positions.
+
     # Page 1: Data/network devices
     page1 = doc.new_page(width=792, height=612)  # 11x8.5 landscape
     page1.insert_text(
         (72, 72),
-        "FIRST FLOOR LOW VOLTAGE PLAN\nDrawing: E-101\nScale: 1/8\" = 1'-0\"",
-        fontsize=14,
-    )
-    page1.insert_text(
-        (72, 150),
+        "FIRST FLOOR LOW VOLTAGE PLAN\nDrawing: E-101\nScale: 1/8\" = 1'-0\"\n"
+        "\n"
         "NETWORK CLOSET IDF-1A\n"
         "1x MDF Cabinet\n"
         "2x Patch Panel (48-port Cat6A)\n"
         "2x Network Switch (48-port PoE+)\n"
-        "1x UPS (3kVA)\n",
-        fontsize=10,
-    )
-    page1.insert_text(
-        (72, 280),
+        "1x UPS (3kVA)\n"
+        "\n"
         "OPEN OFFICE AREA\n"
         "24x Cat6A Data Drop\n"
         "6x Wireless AP (ceiling mount)\n"
@@ -92,20 +117,14 @@ def _create_sample_pdf(ws_dir: str, filename: str = "plans/floor1.pdf") -> str:
     page2 = doc.new_page(width=792, height=612)
     page2.insert_text(
         (72, 72),
-        "FIRST FLOOR SECURITY & FIRE ALARM PLAN\nDrawing: E-102",
-        fontsize=14,
-    )
-    page2.insert_text(
-        (72, 140),
+        "FIRST FLOOR SECURITY & FIRE ALARM PLAN\nDrawing: E-102\n"
+        "\n"
         "MAIN ENTRANCE\n"
         "2x Card Reader (HID iClass SE)\n"
         "2x Door Contact\n"
         "2x REX Device\n"
-        "1x Intercom Station\n",
-        fontsize=10,
-    )
-    page2.insert_text(
-        (72, 260),
+        "1x Intercom Station\n"
+        "\n"
         "FIRE ALARM DEVICES\n"
         "8x Smoke Detector (addressable)\n"
         "4x Horn/Strobe (wall mount)\n"
@@ -114,9 +133,9 @@ def _create_sample_pdf(ws_dir: str, filename: str = "plans/floor1.pdf") -> str:
         fontsize=10,
     )
 
-    doc.save(full)
+    data = doc.tobytes()
     doc.close()
-    return filename
+    return data
 
 
 @pytest.fixture()
@@ -195,10 +214,11 @@ class TestFullPipeline:
         assert docx_result["ok"] is True
         assert os.path.isfile(docx_result["absolute_path"])
 
-        # Verify all 3 artifacts on disk
+        # Verify artifacts on disk — one readdir instead of a stat apiece
         artifacts_dir = os.path.join(ws_dir, "artifacts")
-        assert os.path.isfile(os.path.join(artifacts_dir, "takeoff.xlsx"))
-        assert os.path.isfile(os.path.join(artifacts_dir, "summary.docx"))
+        present = {e.name for e in os.scandir(artifacts_dir)}
+        assert "takeoff.xlsx" in present
+        assert "summary.docx" in present
 
 
 # =====================================================================
@@ -239,6 +259,50 @@ class TestExtractTextSchema:
         assert isinstance(block["bbox"], list)
         assert len(block["bbox"]) == 4
 
+    def test_columnar_schema_fields(self, client, sample_pdf):
+        resp = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_extract_text",
+                "arguments": {
+                    "workspace": "blueprint-proj",
+                    "pdf_path": sample_pdf,
+                    "format": "columnar",
+                },
+            }
+        })
+        body = resp.json()
+        assert body["ok"] is True
+        assert body["page_count"] == 2
+
+        # Columnar pages carry flat parallel lists instead of block dicts
+        page = body["pages"][0]
+        assert "blocks" not in page
+        assert "page" in page
+        assert "width" in page
+        assert "height" in page
+        assert isinstance(page["text"], str)
+        assert isinstance(page["block_text"], list)
+        n_blocks = len(page["block_text"])
+        assert n_blocks > 0
+        for key in ("bbox_x0", "bbox_y0", "bbox_x1", "bbox_y1"):
+            assert isinstance(page[key], list)
+            assert len(page[key]) == n_blocks
+
+    def test_unknown_format_returns_error(self, client, sample_pdf):
+        resp = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_extract_text",
+                "arguments": {
+                    "workspace": "blueprint-proj",
+                    "pdf_path": sample_pdf,
+                    "format": "columnar ",  # typo'd value must not fall through
+                },
+            }
+        })
+        body = resp.json()
+        assert body["ok"] is False
+        assert "format" in body["error"].lower()
+
     def test_missing_pdf_returns_error(self, client):
         resp = client.post("/tool", json={
             "tool_call": {
@@ -363,6 +427,70 @@ class TestTakeoffSchema:
         assert "list" in body["error"].lower()
 
 
+# =====================================================================
+# Test: extracted_text_ref — takeoff from the server-side page cache
+# =====================================================================
+
+class TestTakeoffRef:
+    def test_ref_matches_inline_pages(self, client, sample_pdf):
+        """Takeoff via parse_id ref is identical to posting the pages inline."""
+        r1 = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_extract_text",
+                "arguments": {"workspace": "blueprint-proj", "pdf_path": sample_pdf},
+            }
+        })
+        extract = r1.json()
+        assert extract["ok"] is True
+        assert "parse_id" in extract
+
+        args = {"workspace": "blueprint-proj", "project_name": "Ref Test"}
+        inline = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_takeoff_low_voltage",
+                "arguments": {**args, "extracted_text": extract["pages"]},
+            }
+        }).json()
+        by_ref = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_takeoff_low_voltage",
+                "arguments": {**args, "extracted_text_ref": extract["parse_id"]},
+            }
+        }).json()
+
+        assert inline["ok"] is True
+        assert by_ref["ok"] is True
+        # Only the per-call identifiers may differ
+        for body in (inline, by_ref):
+            body.pop("takeoff_id")
+            body.pop("generated_at")
+        assert by_ref == inline
+
+    def test_unknown_ref_returns_error(self, client):
+        resp = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_takeoff_low_voltage",
+                "arguments": {
+                    "workspace": "blueprint-proj",
+                    "extracted_text_ref": "0" * 40,
+                },
+            }
+        })
+        body = resp.json()
+        assert body["ok"] is False
+        assert "extracted_text_ref" in body["error"]
+
+    def test_ref_param_in_schema(self, client):
+        resp = client.get("/tools")
+        takeoff = next(
+            t["function"] for t in resp.json()["tools"]
+            if t["function"]["name"] == "blueprint_takeoff_low_voltage"
+        )
+        assert "extracted_text_ref" in takeoff["parameters"]["properties"]
+        # Additive only — the inline path stays the required contract
+        assert "extracted_text_ref" not in takeoff["parameters"]["required"]
+
+
 # =====================================================================
 # Test: Output schema stability — artifact_write_xlsx_takeoff
 # =====================================================================
@@ -448,6 +576,63 @@ class TestXlsxSchema:
         assert "line_items" in body["error"]
 
 
+# =====================================================================
+# Test: XLSX_FAST_WRITER parity with the openpyxl writer
+# =====================================================================
+
+class TestXlsxFastWriterParity:
+    def test_fast_writer_matches_openpyxl(self, client, sample_pdf, monkeypatch):
+        """Both writers must emit cell-for-cell identical values."""
+        r1 = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_extract_text",
+                "arguments": {"workspace": "blueprint-proj", "pdf_path": sample_pdf},
+            }
+        })
+        takeoff = client.post("/tool", json={
+            "tool_call": {
+                "name": "blueprint_takeoff_low_voltage",
+                "arguments": {
+                    "workspace": "blueprint-proj",
+                    "extracted_text": r1.json()["pages"],
+                    "project_name": "Parity Test",
+                },
+            }
+        }).json()
+
+        def write(output_path):
+            return client.post("/tool", json={
+                "tool_call": {
+                    "name": "artifact_write_xlsx_takeoff",
+                    "arguments": {
+                        "workspace": "blueprint-proj",
+                        "takeoff_json": takeoff,
+                        "output_path": output_path,
+                    },
+                }
+            }).json()
+
+        monkeypatch.delenv("XLSX_FAST_WRITER", raising=False)
+        slow = write("artifacts/takeoff_openpyxl.xlsx")
+        monkeypatch.setenv("XLSX_FAST_WRITER", "1")
+        fast = write("artifacts/takeoff_fast.xlsx")
+
+        assert slow["ok"] is True
+        assert fast["ok"] is True
+        assert fast["sheets"] == slow["sheets"]
+        assert fast["row_count"] == slow["row_count"]
+
+        wb_slow = openpyxl.load_workbook(slow["absolute_path"])
+        wb_fast = openpyxl.load_workbook(fast["absolute_path"])
+        assert wb_fast.sheetnames == wb_slow.sheetnames
+        for name in wb_slow.sheetnames:
+            rows_slow = list(wb_slow[name].iter_rows(values_only=True))
+            rows_fast = list(wb_fast[name].iter_rows(values_only=True))
+            assert rows_fast == rows_slow
+        wb_slow.close()
+        wb_fast.close()
+
+
 # =====================================================================
 # Test: Output schema stability — artifact_write_docx_summary
 # =====================================================================
@@ -572,6 +757,16 @@ class TestToolRegistration:
         assert "workspace" in docx["parameters"]["required"]
         assert "takeoff_json" in docx["parameters"]["required"]
 
+    def test_get_tool_schema_lookup(self):
+        """get_tool_schema resolves a known name and misses return None."""
+        from router.app import tool_schemas
+
+        entry = tool_schemas.get_tool_schema("blueprint_extract_text")
+        assert entry is not None
+        assert entry["function"]["name"] == "blueprint_extract_text"
+        assert entry in tool_schemas.TOOLS
+        assert tool_schemas.get_tool_schema("no_such_tool") is None
+
 
 # =====================================================================
 # Test: Workspace validation applies to blueprint tools
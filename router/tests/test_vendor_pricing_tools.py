@@ -10,10 +10,9 @@ Validates:
   - Error cases produce stable JSON (never null)
 """
 
-import importlib
 import json
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -21,6 +20,9 @@ from fastapi.testclient import TestClient
 
 # ---- Fixtures ----
 
+# WORKSPACE_ROOT is read lazily by the app, so per-test setup is a
+# setenv plus resetting the vendor module's mutable state (limiter,
+# breaker, response cache) — no module reloads.
 @pytest.fixture(autouse=True)
 def _workspace_root(tmp_path, monkeypatch):
     """Set up a temp WORKSPACE_ROOT so the app can initialize."""
@@ -31,18 +33,26 @@ def _workspace_root(tmp_path, monkeypatch):
 
     monkeypatch.setenv("WORKSPACE_ROOT", str(ws_root))
     monkeypatch.setenv("ROUTER_AUTH_TOKEN", "")
-    monkeypatch.setenv("VENDOR_RATE_LIMIT_RPM", "600")  # high limit for tests
 
-    from router.app import workspace_tools, vendor_pricing_tools, tools, main
-    importlib.reload(vendor_pricing_tools)
-    importlib.reload(workspace_tools)
-    importlib.reload(tools)
-    importlib.reload(main)
+    from router.app import tools, vendor_pricing_tools as vpt
+    tools.invalidate_workspace_cache()
+    # High limit for tests; fresh breaker/cache so failures injected by
+    # one test never bleed into the next.
+    monkeypatch.setattr(vpt, "_limiter", vpt._RateLimiter(rpm=600))
+    monkeypatch.setattr(
+        vpt,
+        "_breaker",
+        vpt._CircuitBreaker(
+            threshold=vpt.CIRCUIT_BREAKER_THRESHOLD,
+            reset_sec=vpt.CIRCUIT_BREAKER_RESET_SEC,
+        ),
+    )
+    vpt._cache.clear()
 
     yield str(ws_root)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client():
     from router.app.main import app
     return TestClient(app, raise_server_exceptions=False)
@@ -95,27 +105,47 @@ def _mock_empty_html():
     return '<html><body><p>No results found</p></body></html>'
 
 
+# Plain classes instead of MagicMock: attribute access on a MagicMock
+# walks its _mock_children bookkeeping on every call, which adds up when
+# the adapters poke status_code/text for every vendor in every test.
+class _CannedResponse:
+    __slots__ = ("status_code", "text")
+
+    def __init__(self, text: str, status_code: int = 200):
+        self.status_code = status_code
+        self.text = text
+
+
+class _CannedSession:
+    """Minimal requests.Session stand-in routing GETs by vendor domain."""
+
+    def __init__(self, vendor_html: dict):
+        self._vendor_html = vendor_html
+
+    def get(self, url, **kwargs):
+        for domain, html in self._vendor_html.items():
+            if domain in url:
+                return _CannedResponse(html)
+        return _CannedResponse(_mock_empty_html())
+
+
 def _mock_session_factory(grainger_html=None, graybar_html=None, hdsupply_html=None):
-    """Build a mock requests.Session that returns canned HTML per vendor."""
-    vendor_html = {
+    """Build a fake requests.Session that returns canned HTML per vendor."""
+    return _CannedSession({
         "grainger.com": grainger_html or _mock_empty_html(),
         "graybar.com": graybar_html or _mock_empty_html(),
         "hdsupply.com": hdsupply_html or _mock_empty_html(),
-    }
+    })
+
+
+class _FailingSession:
+    """Session stand-in whose every GET raises — stateless, reused across tests."""
+
+    def get(self, url, **kwargs):
+        raise RuntimeError("network boom")
 
-    def _mock_get(url, **kwargs):
-        resp = MagicMock()
-        resp.status_code = 200
-        for domain, html in vendor_html.items():
-            if domain in url:
-                resp.text = html
-                return resp
-        resp.text = _mock_empty_html()
-        return resp
 
-    session = MagicMock()
-    session.get = _mock_get
-    return session
+_FAILING_SESSION = _FailingSession()
 
 
 # =====================================================================
@@ -290,9 +320,7 @@ class TestNoNullContent:
     def test_adapter_exception_produces_stable_json(self, client):
         """Even if an adapter raises, we still get valid JSON."""
         with patch("router.app.vendor_pricing_tools._http_session") as mock_session:
-            session = MagicMock()
-            session.get.side_effect = Exception("network boom")
-            mock_session.return_value = session
+            mock_session.return_value = _FAILING_SESSION
 
             resp = client.post("/tool", json={
                 "tool_call": {
@@ -353,7 +381,7 @@ class TestVendorPriceCheck:
         body = resp.json()
         result = body["result"]
         required_fields = {"vendor", "sku", "price", "availability", "leadTime", "url", "confidence"}
-        assert required_fields.issubset(set(result.keys()))
+        assert required_fields <= result.keys()
 
     def test_invalid_vendor_returns_error(self, client):
         resp = client.post("/tool", json={
@@ -501,11 +529,11 @@ class TestSafeguards:
         assert 503 in adapter.max_retries.status_forcelist
 
     def test_request_timeout_configurable(self, monkeypatch):
-        """REQUEST_TIMEOUT env var is respected."""
-        monkeypatch.setenv("VENDOR_REQUEST_TIMEOUT", "42")
+        """VENDOR_REQUEST_TIMEOUT env var is respected without a reload."""
         from router.app import vendor_pricing_tools
-        importlib.reload(vendor_pricing_tools)
-        assert vendor_pricing_tools.REQUEST_TIMEOUT == 42
+
+        monkeypatch.setenv("VENDOR_REQUEST_TIMEOUT", "42")
+        assert vendor_pricing_tools._request_timeout() == 42
 
 
 # =====================================================================
@@ -520,12 +548,12 @@ class TestResultSchema:
     def test_match_result_has_all_keys(self):
         from router.app.vendor_pricing_tools import _make_result
         result = _make_result("grainger", "test", sku="A", price=1.0)
-        assert self.REQUIRED_KEYS.issubset(set(result.keys()))
+        assert self.REQUIRED_KEYS <= result.keys()
 
     def test_empty_result_has_all_keys(self):
         from router.app.vendor_pricing_tools import _empty_result
         result = _empty_result("grainger", "test")
-        assert self.REQUIRED_KEYS.issubset(set(result.keys()))
+        assert self.REQUIRED_KEYS <= result.keys()
         assert result["confidence"] == 0.0
         assert result["sku"] == ""
         assert result["availability"] == "unknown"
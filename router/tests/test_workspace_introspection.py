@@ -23,18 +23,17 @@ def _workspace_root(tmp_path, monkeypatch):
     monkeypatch.setenv("WORKSPACE_ROOT", str(ws_root))
     monkeypatch.setenv("ROUTER_AUTH_TOKEN", "")  # disable auth for tests
 
-    # Force module reimport so WORKSPACE_ROOT picks up the env var
-    import importlib
-    from router.app import workspace_tools, tools, main
-
-    importlib.reload(workspace_tools)
-    importlib.reload(tools)
-    importlib.reload(main)
+    # WORKSPACE_ROOT is read lazily by the app; just drop the cached
+    # workspace-ID set so the new root is seen immediately.
+    from router.app import tools
+    tools.invalidate_workspace_cache()
 
     yield str(ws_root)
 
 
-@pytest.fixture()
+# Module-scoped: one ASGI transport for the whole module instead of a
+# fresh TestClient per test.
+@pytest.fixture(scope="module")
 def client():
     from router.app.main import app
     return TestClient(app, raise_server_exceptions=False)